@@ -4,55 +4,136 @@
 
 import streamlit as st
 import streamlit.components.v1 as components
-import pandas as pd
+import json
+import tempfile
 from io import BytesIO
+from collections import Counter
 from datetime import datetime
-from scrapers import scrape_all_universities, UNIVERSITIES
+from scrapers import scrape_all_universities, empty_news, UNIVERSITIES
 
+# 爬取结果缓存时间（秒）
+SCRAPE_CACHE_TTL = 600
 
-def convert_to_excel(news_list):
-    """将新闻列表转换为Excel文件"""
-    df = pd.DataFrame(news_list)
-    # 重命名列
-    df = df.rename(columns={
-        "source": "来源",
-        "title": "新闻标题",
-        "date": "发布日期",
-        "url": "原文链接"
-    })
-    # 调整列顺序
-    df = df[["来源", "新闻标题", "发布日期", "原文链接"]]
+# Excel 文件缓存时间（秒）
+EXCEL_CACHE_TTL = 600
+
+# Excel 文件缓存的最大条目数
+EXCEL_CACHE_MAX_ENTRIES = 4
+
+# Excel 表头
+_EXCEL_HEADERS = ("来源", "新闻标题", "发布日期", "原文链接")
+
+# Excel 列宽：来源、新闻标题、发布日期、原文链接
+_COL_WIDTHS = (('A:A', 18), ('B:B', 60), ('C:C', 12), ('D:D', 50))
+
+# Excel 表头格式
+_HEADER_FORMAT_DICT = {
+    'bold': True,
+    'bg_color': '#1e3a5f',
+    'font_color': 'white',
+    'align': 'center',
+    'valign': 'vcenter',
+    'border': 1
+}
+
+
+@st.cache_data(ttl=SCRAPE_CACHE_TTL, show_spinner=False)
+def cached_scrape_all():
+    """爬取所有高校新闻，成功的结果在缓存时间内复用"""
+    return scrape_all_universities()
+
+
+def _excel_by_xlsxwriter(news):
+    """使用 xlsxwriter 直接生成Excel文件"""
+    # 首次显示爬取结果（生成下载文件）时才导入，页面初次加载无需导入
+    import xlsxwriter
     
-    # 创建Excel文件
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False, sheet_name='统战新闻')
-        
-        # 获取工作表
-        workbook = writer.book
-        worksheet = writer.sheets['统战新闻']
-        
-        # 设置列宽
-        worksheet.set_column('A:A', 18)  # 来源
-        worksheet.set_column('B:B', 60)  # 新闻标题
-        worksheet.set_column('C:C', 12)  # 发布日期
-        worksheet.set_column('D:D', 50)  # 原文链接
-        
-        # 设置表头格式
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#1e3a5f',
-            'font_color': 'white',
-            'align': 'center',
-            'valign': 'vcenter',
-            'border': 1
-        })
-        
-        for col_num, value in enumerate(df.columns.values):
-            worksheet.write(0, col_num, value, header_format)
+    # constant_memory 模式下逐行写入临时文件，行必须按顺序写入
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'tmpdir': tempfile.gettempdir()
+    })
+    worksheet = workbook.add_worksheet('统战新闻')
+    
+    # 设置列宽
+    for col_range, width in _COL_WIDTHS:
+        worksheet.set_column(col_range, width)
+    
+    # 设置表头格式
+    header_format = workbook.add_format(_HEADER_FORMAT_DICT)
+    worksheet.write_row(0, 0, _EXCEL_HEADERS, header_format)
     
+    # 逐行写入新闻（constant_memory 模式不支持按列写入）
+    rows = zip(news["source"], news["title"], news["date"], news["url"])
+    for row, (source, title, date_text, url) in enumerate(rows, start=1):
+        worksheet.write_string(row, 0, source)
+        worksheet.write_string(row, 1, title)
+        worksheet.write_string(row, 2, date_text)
+        worksheet.write_url(row, 3, url)
+    
+    workbook.close()
     return output.getvalue()
 
+
+def _excel_by_openpyxl(news):
+    """使用 openpyxl 的 write_only 模式流式生成Excel文件"""
+    # 首次显示爬取结果（生成下载文件）时才导入，页面初次加载无需导入
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+    
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet('统战新闻')
+    
+    # 设置列宽（write_only 模式下需在写入行之前设置）
+    for col_range, width in _COL_WIDTHS:
+        worksheet.column_dimensions[col_range.split(':')[0]].width = width
+    
+    # 设置表头格式
+    header_font = Font(bold=True, color='FFFFFF')
+    header_fill = PatternFill(fill_type='solid', start_color='1E3A5F', end_color='1E3A5F')
+    header_alignment = Alignment(horizontal='center', vertical='center')
+    thin = Side(style='thin')
+    header_border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    
+    header_row = []
+    for value in _EXCEL_HEADERS:
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        cell.border = header_border
+        header_row.append(cell)
+    worksheet.append(header_row)
+    
+    # 链接格式与 xlsxwriter 的 write_url 默认格式一致（蓝色下划线）
+    link_font = Font(color='0000FF', underline='single')
+    
+    # 逐行写入新闻，原文链接写为可点击的超链接
+    for source, title, date_text, url in zip(news["source"], news["title"], news["date"], news["url"]):
+        url_cell = WriteOnlyCell(worksheet, value=url)
+        url_cell.hyperlink = url
+        url_cell.font = link_font
+        worksheet.append((source, title, date_text, url_cell))
+    
+    output = BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+# Excel 生成引擎
+EXCEL_ENGINES = {
+    "xlsxwriter": _excel_by_xlsxwriter,
+    "openpyxl": _excel_by_openpyxl,
+}
+
+
+@st.cache_data(ttl=EXCEL_CACHE_TTL, max_entries=EXCEL_CACHE_MAX_ENTRIES, show_spinner=False)
+def convert_to_excel(news, engine="xlsxwriter"):
+    """将新闻数据（按列存储）转换为Excel文件，相同的新闻数据直接复用已生成的文件"""
+    return EXCEL_ENGINES[engine](news)
+
 # 页面配置
 st.set_page_config(
     page_title="高校统战部新闻爬取工具",
@@ -189,7 +270,7 @@ with col2:
 
 # 会话状态存储
 if "news_data" not in st.session_state:
-    st.session_state.news_data = []
+    st.session_state.news_data = empty_news()
 if "errors" not in st.session_state:
     st.session_state.errors = []
 if "fetched" not in st.session_state:
@@ -198,7 +279,10 @@ if "fetched" not in st.session_state:
 # 爬取逻辑
 if fetch_button:
     with st.spinner("正在爬取各高校统战部新闻，请稍候..."):
-        news, errors = scrape_all_universities()
+        news, errors = cached_scrape_all()
+        # 只缓存完整成功的结果，有站点失败时下次点击重新爬取
+        if errors:
+            cached_scrape_all.clear()
         st.session_state.news_data = news
         st.session_state.errors = errors
         st.session_state.fetched = True
@@ -210,18 +294,16 @@ if st.session_state.fetched:
         st.warning("⚠️ " + " | ".join(st.session_state.errors))
     
     news = st.session_state.news_data
+    news_count = len(news["title"])
     
-    if news:
+    if news_count:
         # 统计信息
-        source_counts = {}
-        for item in news:
-            source = item["source"]
-            source_counts[source] = source_counts.get(source, 0) + 1
+        source_counts = Counter(news["source"])
         
         st.markdown(f"""
         <div class="stats-container">
             <div class="stat-item">
-                <div class="stat-number">{len(news)}</div>
+                <div class="stat-number">{news_count}</div>
                 <div class="stat-label">新闻总数</div>
             </div>
             <div class="stat-item">
@@ -260,36 +342,89 @@ if st.session_state.fetched:
                 return "source-shsy"
             return "source-default"
         
-        table_html = """
-        <table class="news-table">
-            <thead>
-                <tr>
-                    <th style="width: 120px;">来源</th>
-                    <th>新闻标题</th>
-                    <th style="width: 120px;">发布日期</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for item in news:
-            source_class = get_source_class(item["source"])
-            table_html += f"""
-                <tr>
-                    <td><span class="source-tag {source_class}">{item['source']}</span></td>
-                    <td><a href="{item['url']}" target="_blank" rel="noopener noreferrer">{item['title']}</a></td>
-                    <td class="date-text">{item['date']}</td>
-                </tr>
-            """
+        # 表格数据以 JSON 形式交给前端，只渲染可视区域内的行（虚拟滚动）
+        table_data = json.dumps({
+            "source": news["source"],
+            "sourceClass": [get_source_class(source) for source in news["source"]],
+            "title": news["title"],
+            "date": news["date"],
+            "url": news["url"],
+        }, ensure_ascii=False).replace("<", "\\u003c")
         
-        table_html += """
-            </tbody>
-        </table>
+        table_script = """
+            const ROW_HEIGHT = 45;
+            const BUFFER_ROWS = 10;
+            const viewport = document.getElementById("viewport");
+            const tbody = document.getElementById("news-rows");
+            const total = NEWS.title.length;
+            
+            function spacer(height) {
+                const tr = document.createElement("tr");
+                const td = document.createElement("td");
+                td.colSpan = 3;
+                td.className = "spacer";
+                td.style.height = height + "px";
+                tr.appendChild(td);
+                return tr;
+            }
+            
+            function newsRow(i) {
+                const tr = document.createElement("tr");
+                tr.className = "news-row";
+                
+                const sourceCell = document.createElement("td");
+                const tag = document.createElement("span");
+                tag.className = "source-tag " + NEWS.sourceClass[i];
+                tag.textContent = NEWS.source[i];
+                sourceCell.appendChild(tag);
+                
+                const titleCell = document.createElement("td");
+                const link = document.createElement("a");
+                link.href = NEWS.url[i];
+                link.target = "_blank";
+                link.rel = "noopener noreferrer";
+                link.title = NEWS.title[i];
+                link.textContent = NEWS.title[i];
+                titleCell.appendChild(link);
+                
+                const dateCell = document.createElement("td");
+                dateCell.className = "date-text";
+                dateCell.textContent = NEWS.date[i];
+                
+                tr.append(sourceCell, titleCell, dateCell);
+                return tr;
+            }
+            
+            function render() {
+                const visibleRows = Math.ceil(viewport.clientHeight / ROW_HEIGHT);
+                const start = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - BUFFER_ROWS);
+                const end = Math.min(total, start + visibleRows + BUFFER_ROWS * 2);
+                
+                const fragment = document.createDocumentFragment();
+                fragment.appendChild(spacer(start * ROW_HEIGHT));
+                for (let i = start; i < end; i++) {
+                    fragment.appendChild(newsRow(i));
+                }
+                fragment.appendChild(spacer((total - end) * ROW_HEIGHT));
+                tbody.replaceChildren(fragment);
+            }
+            
+            let pending = false;
+            viewport.addEventListener("scroll", () => {
+                if (!pending) {
+                    pending = true;
+                    requestAnimationFrame(() => {
+                        pending = false;
+                        render();
+                    });
+                }
+            });
+            render();
         """
         
         # 使用 components.html 渲染可点击的表格
-        # 计算表格高度：每行约45px + 表头60px，最大2000px确保能显示更多内容
-        table_height = min(len(news) * 45 + 80, 2000)
+        # 计算表格高度：每行45px + 表头60px，最大2000px确保能显示更多内容
+        table_height = min(news_count * 45 + 80, 2000)
         
         full_html = f"""
         <html>
@@ -300,9 +435,14 @@ if st.session_state.fetched:
                     margin: 0;
                     padding: 0;
                 }}
+                #viewport {{
+                    height: 100vh;
+                    overflow-y: auto;
+                }}
                 .news-table {{
                     width: 100%;
                     border-collapse: collapse;
+                    table-layout: fixed;
                     font-size: 14px;
                 }}
                 .news-table th {{
@@ -315,10 +455,20 @@ if st.session_state.fetched:
                     top: 0;
                 }}
                 .news-table td {{
-                    padding: 12px 16px;
+                    padding: 0 16px;
                     border-bottom: 1px solid #e8eef3;
+                    white-space: nowrap;
+                    overflow: hidden;
+                    text-overflow: ellipsis;
+                }}
+                .news-table tr.news-row {{
+                    height: 45px;
                 }}
-                .news-table tr:hover {{
+                .news-table td.spacer {{
+                    padding: 0;
+                    border: none;
+                }}
+                .news-table tr.news-row:hover {{
                     background-color: #f5f9fc;
                 }}
                 .news-table a {{
@@ -352,11 +502,24 @@ if st.session_state.fetched:
             </style>
         </head>
         <body>
-            {table_html}
+            <div id="viewport">
+                <table class="news-table">
+                    <thead>
+                        <tr>
+                            <th style="width: 120px;">来源</th>
+                            <th>新闻标题</th>
+                            <th style="width: 120px;">发布日期</th>
+                        </tr>
+                    </thead>
+                    <tbody id="news-rows"></tbody>
+                </table>
+            </div>
+            <script>const NEWS = {table_data};</script>
+            <script>{table_script}</script>
         </body>
         </html>
         """
-        components.html(full_html, height=table_height, scrolling=True)
+        components.html(full_html, height=table_height)
     else:
         st.info("未获取到新闻数据，请检查网络连接或稍后重试。")
 else:
@@ -3,16 +3,40 @@
 支持复旦大学、上海交通大学、同济大学
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import codecs
+import aiohttp
+import orjson
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from typing import List, Dict, Optional
 import re
 
+# 新闻字段，新闻数据按字段分列存储: {"source": [...], "title": [...], ...}
+# date_key 为 (年, 月, 日) 整数元组，用于排序
+NEWS_FIELDS = ("source", "title", "date", "url", "date_key")
+
+NewsColumns = Dict[str, list]
+
 # 请求超时时间（秒）
 REQUEST_TIMEOUT = 5
 
+# 单个页面最多读取的字节数
+MAX_PAGE_BYTES = 256 * 1024
+
+# 请求失败时的重试次数
+FETCH_RETRIES = 1
+
+# 重试前的退避时间（秒），每次重试翻倍
+RETRY_BACKOFF = 0.2
+
+# 连接池大小
+MAX_CONNECTIONS = 10
+
+# DNS 缓存时间（秒）
+DNS_CACHE_TTL = 300
+
 # 请求头，模拟浏览器访问
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -20,6 +44,48 @@ HEADERS = {
     "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
 }
 
+# 日期匹配，如 2024-01-01 或 2024/1/1
+_DATE_RE = re.compile(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2})")
+
+# 日期匹配（允许点号分隔），如 2024.01.01
+_DOTTED_DATE_RE = re.compile(r"(\d{4}[-/.]\d{1,2}[-/.]\d{1,2})")
+
+# 交大标题开头的日期前缀
+_SJTU_DATE_STRIP_RE = re.compile(r"^\d{4}[-/.]\d{1,2}[-/.]\d{1,2}\s*")
+
+# 上海市社会主义学院 JS 中的新闻数组，格式: var gzdtList = [...]
+_GZDT_RE = re.compile(r"var\s+gzdtList\s*=\s*(\[.*\])", re.DOTALL)
+
+# 日期的年、月、日部分
+_DATE_KEY_RE = re.compile(r"(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})")
+
+# 页面开头的 XML 声明，如 <?xml version="1.0" encoding="utf-8"?>
+_XML_DECL_RE = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+# 日期 span 的 class 名
+_DATE_CLASS_RE = re.compile(r"date|time|Article_PublishDate")
+
+# 页面 <meta> 中声明的编码
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+# WHATWG 编码标准中按 GBK 处理的编码标签，统一按其超集 gb18030 解码
+_GBK_LABELS = frozenset([
+    "chinese", "csgb2312", "csiso58gb231280", "gb2312", "gb_2312", "gb_2312-80",
+    "gbk", "iso-ir-58", "x-gbk", "cp936"
+])
+
+# 导航类链接关键词
+_NAV_KEYWORDS = frozenset([
+    "首页", "更多", "详情", "查看", "点击", "下载", "登录", "注册",
+    "部门概况", "统战团体", "民主党派", "参政议政", "理论园地", "服务指南",
+    "复旦统战", "两会专题", "交大首页", "智慧统战", "中国人大网", "中国政协网",
+    "中央统战部", "上海统一战线", "民革", "民盟", "民建", "民进", "农工党",
+    "致公党", "九三学社", "台盟", "侨联", "欧美同学会", "知联会", "台联", "民族联"
+])
+
+# 导航关键词子串匹配
+_NAV_KEYWORDS_RE = re.compile("|".join(map(re.escape, sorted(_NAV_KEYWORDS))))
+
 # 高校配置
 UNIVERSITIES = {
     "复旦大学": {
@@ -50,21 +116,85 @@ UNIVERSITIES = {
     "上海市社会主义学院": {
         "url": "https://www.shsy.org.cn/node933/shsy/tzll/gzdt/index.html",
         "base_url": "https://www.shsy.org.cn",
-        "parser": "shsy"
+        "parser": "shsy",
+        # 新闻数据在 JS 文件中，直接获取该文件而不是列表页
+        "data_url": "https://www.shsy.org.cn/json/gzdt.js",
+        "content_type": "js_jsonp"
     }
 }
 
 
-def fetch_page(url: str) -> Optional[str]:
-    """获取网页内容"""
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+def _detect_encoding(response: aiohttp.ClientResponse, body: bytes) -> str:
+    """
+    确定页面编码：优先使用响应头中的 charset，
+    其次查找页面前 2KB 中的 <meta charset>，都没有时默认 utf-8
+    """
+    encoding = response.charset
+    if not encoding:
+        match = _META_CHARSET_RE.search(body, 0, 2048)
+        if match:
+            encoding = match.group(1).decode("ascii")
+    if encoding:
+        # 声明为 gb2312/gbk 的页面常含超出该字符集的字符，与浏览器一样按 gb18030 解码
+        if encoding.strip().lower() in _GBK_LABELS:
+            return "gb18030"
+        try:
+            name = codecs.lookup(encoding).name
+        except LookupError:
+            return "utf-8"
+        return "gb18030" if name in _GBK_LABELS else name
+    return "utf-8"
+
+
+async def _fetch_once(session: aiohttp.ClientSession, url: str,
+                      max_bytes: Optional[int]) -> str:
+    """发起一次请求并返回解码后的页面内容，失败时抛出异常"""
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with session.get(url, timeout=timeout) as response:
         response.raise_for_status()
-        response.encoding = response.apparent_encoding
-        return response.text
-    except Exception as e:
-        print(f"获取页面失败 {url}: {e}")
-        return None
+        if max_bytes is None:
+            body = await response.read()
+        else:
+            # 列表页只需要页面前部，超过上限的部分（页脚等）不再读取
+            chunks = []
+            remaining = max_bytes
+            while remaining > 0:
+                chunk = await response.content.read(remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            body = b"".join(chunks)
+        return body.decode(_detect_encoding(response, body), errors="replace")
+
+
+async def fetch_page(session: aiohttp.ClientSession, url: str,
+                     max_bytes: Optional[int] = MAX_PAGE_BYTES) -> Optional[str]:
+    """获取网页内容，max_bytes 为 None 时读取完整内容；网络错误或 5xx 时退避重试"""
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            return await _fetch_once(session, url, max_bytes)
+        except Exception as e:
+            # 4xx 等客户端错误重试也无济于事
+            retryable = not (isinstance(e, aiohttp.ClientResponseError) and e.status < 500)
+            if retryable and attempt < FETCH_RETRIES:
+                await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+                continue
+            print(f"获取页面失败 {url}: {e}")
+            return None
+
+
+def empty_news() -> NewsColumns:
+    """创建空的按列存储的新闻数据"""
+    return {field: [] for field in NEWS_FIELDS}
+
+
+def _date_key(date_text: str) -> tuple[int, int, int]:
+    """将日期文本转换为 (年, 月, 日) 元组，无法识别时返回 (0, 0, 0)"""
+    match = _DATE_KEY_RE.search(date_text)
+    if match:
+        return (int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    return (0, 0, 0)
 
 
 def is_valid_news(title: str, url: str, date_text: str) -> bool:
@@ -73,23 +203,13 @@ def is_valid_news(title: str, url: str, date_text: str) -> bool:
     if len(title) < 6:
         return False
     
-    # 过滤掉导航类链接
-    nav_keywords = [
-        "首页", "更多", "详情", "查看", "点击", "下载", "登录", "注册",
-        "部门概况", "统战团体", "民主党派", "参政议政", "理论园地", "服务指南",
-        "复旦统战", "两会专题", "交大首页", "智慧统战", "中国人大网", "中国政协网",
-        "中央统战部", "上海统一战线", "民革", "民盟", "民建", "民进", "农工党", 
-        "致公党", "九三学社", "台盟", "侨联", "欧美同学会", "知联会", "台联", "民族联"
-    ]
-    
     # 如果标题完全匹配导航关键词，过滤掉
-    if title in nav_keywords:
+    if title in _NAV_KEYWORDS:
         return False
     
-    # 如果标题很短且是导航关键词的一部分
-    for kw in nav_keywords:
-        if title == kw or (len(title) < 10 and kw in title):
-            return False
+    # 如果标题很短且包含导航关键词
+    if len(title) < 10 and _NAV_KEYWORDS_RE.search(title):
+        return False
     
     # 过滤掉外部链接（非本站新闻页面）
     if "list.htm" in url and "/c" not in url:
@@ -102,96 +222,112 @@ def is_valid_news(title: str, url: str, date_text: str) -> bool:
     return True
 
 
-def parse_fudan(html: str, base_url: str) -> List[Dict]:
+def _parse_generic(html: str, base_url: str, source: str) -> NewsColumns:
     """
-    解析复旦大学统战部新闻列表
+    解析通用的 list.htm 新闻列表页（复旦、同济、华东师大、上师大共用）
     网页结构：新闻列表在 <ul> 中，每条新闻为 <li>，包含 <a> 标签和日期
     """
-    news_list = []
-    soup = BeautifulSoup(html, "lxml")
+    sources, titles, dates, urls, date_keys = [], [], [], [], []
+    tree = LexborHTMLParser(html)
     
     # 查找新闻列表项 - 更精确的选择器
-    news_items = soup.select("ul.news_list li, ul.wp_article_list li, div.news_list li")
+    # Lexbor 对组合选择器中每个匹配的选择器各返回一次节点（如 div.news_list 内嵌 ul.news_list），
+    # 因此按节点 mem_id 去重，并按文档顺序重新取出
+    matched = {node.mem_id for node in tree.css("ul.news_list li, ul.wp_article_list li, div.news_list li")}
+    news_items = [li for li in tree.css("li") if li.mem_id in matched] if matched else []
     
     if not news_items:
         # 备选：查找包含日期的 li
-        news_items = []
-        for li in soup.find_all("li"):
-            text = li.get_text()
-            if re.search(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}", text):
-                news_items.append(li)
+        news_items = [
+            li for li in tree.css("li")
+            if _DATE_RE.search(li.text())
+        ]
     
     for item in news_items:
         try:
             # 查找标题链接
-            link = item.find("a")
-            if not link or not link.get("href"):
+            link = item.css_first("a")
+            if link is None:
+                continue
+            href = link.attributes.get("href") or ""
+            if not href:
                 continue
             
-            title = link.get_text(strip=True)
-            href = link.get("href", "")
+            title = link.text(strip=True)
             url = urljoin(base_url, href)
             
             # 查找日期
             date_text = ""
             # 方法1：查找 span 中的日期
-            date_span = item.find("span", class_=re.compile(r"date|time|Article_PublishDate"))
-            if date_span:
-                date_text = date_span.get_text(strip=True)
+            date_span = None
+            for span in item.css("span"):
+                if _DATE_CLASS_RE.search(span.attributes.get("class") or ""):
+                    date_span = span
+                    break
+            if date_span is not None:
+                date_text = date_span.text(strip=True)
             else:
                 # 方法2：从整个 li 文本中提取日期
-                item_text = item.get_text()
-                date_match = re.search(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2})", item_text)
+                item_text = item.text()
+                date_match = _DATE_RE.search(item_text)
                 if date_match:
                     date_text = date_match.group(1).replace("/", "-")
             
             # 验证是否为有效新闻
             if is_valid_news(title, url, date_text):
-                news_list.append({
-                    "source": "复旦大学",
-                    "title": title,
-                    "date": date_text,
-                    "url": url
-                })
+                sources.append(source)
+                titles.append(title)
+                dates.append(date_text)
+                urls.append(url)
+                date_keys.append(_date_key(date_text))
         except Exception:
             continue
     
-    return news_list
+    return {"source": sources, "title": titles, "date": dates, "url": urls, "date_key": date_keys}
 
 
-def parse_sjtu(html: str, base_url: str) -> List[Dict]:
+def parse_sjtu(html: str, base_url: str) -> NewsColumns:
     """
     解析上海交通大学统战部新闻列表
     交大网站新闻链接格式为 /post/xxx
     """
-    news_list = []
-    soup = BeautifulSoup(html, "lxml")
+    # 仅交大使用 lxml，在首次解析时才导入
+    from lxml import etree, html as lxml_html
+    
+    sources, titles, dates, urls, date_keys = [], [], [], [], []
+    # lxml 不接受带编码声明的 Unicode 字符串，先去掉开头的 XML 声明
+    html = _XML_DECL_RE.sub("", html, count=1)
+    try:
+        doc = lxml_html.fromstring(html)
+    except etree.ParserError:
+        # 空页面，没有新闻
+        return empty_news()
     
     # 查找所有包含 /post/ 的链接（这是交大新闻的特征）
-    news_links = soup.find_all("a", href=lambda x: x and "/post/" in x)
+    news_links = doc.xpath('//a[contains(@href, "/post/")]')
     
     for link in news_links:
         try:
             href = link.get("href", "")
             url = urljoin(base_url, href)
             
-            # 获取标题文本
-            title = link.get_text(strip=True)
+            # 获取标题文本（各文本节点分别去除首尾空白后拼接）
+            title = "".join(text.strip() for text in link.itertext())
             
             # 从标题或父元素中提取日期
             date_text = ""
             # 先尝试从标题中提取日期
-            date_match = re.search(r"(\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})", title)
+            date_match = _DOTTED_DATE_RE.search(title)
             if date_match:
                 date_text = date_match.group(1).replace(".", "-").replace("/", "-")
                 # 从标题中去掉日期部分
-                title = re.sub(r"^\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2}\s*", "", title)
+                title = _SJTU_DATE_STRIP_RE.sub("", title)
             else:
                 # 从父元素中查找日期
-                parent = link.find_parent()
-                if parent:
-                    parent_text = parent.get_text()
-                    date_match = re.search(r"(\d{4}[-/\.]\d{1,2}[-/\.]\d{1,2})", parent_text)
+                parent = link.getparent()
+                if parent is not None:
+                    parent_text = parent.text_content()
+                    date_match = _DOTTED_DATE_RE.search(parent_text)
                     if date_match:
                         date_text = date_match.group(1).replace(".", "-").replace("/", "-")
             
@@ -200,197 +336,31 @@ def parse_sjtu(html: str, base_url: str) -> List[Dict]:
             
             # 验证是否为有效新闻
             if title and len(title) >= 6 and date_text:
-                news_list.append({
-                    "source": "上海交通大学",
-                    "title": title,
-                    "date": date_text,
-                    "url": url
-                })
+                sources.append("上海交通大学")
+                titles.append(title)
+                dates.append(date_text)
+                urls.append(url)
+                date_keys.append(_date_key(date_text))
         except Exception:
             continue
     
-    return news_list
+    return {"source": sources, "title": titles, "date": dates, "url": urls, "date_key": date_keys}
 
 
-def parse_tongji(html: str, base_url: str) -> List[Dict]:
-    """
-    解析同济大学统战部新闻列表
-    网页结构类似复旦，使用 list.htm 格式
-    """
-    news_list = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    # 查找新闻列表项 - 更精确的选择器
-    news_items = soup.select("ul.news_list li, ul.wp_article_list li, div.news_list li")
-    
-    if not news_items:
-        # 备选：查找包含日期的 li
-        news_items = []
-        for li in soup.find_all("li"):
-            text = li.get_text()
-            if re.search(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}", text):
-                news_items.append(li)
-    
-    for item in news_items:
-        try:
-            link = item.find("a")
-            if not link or not link.get("href"):
-                continue
-            
-            title = link.get_text(strip=True)
-            href = link.get("href", "")
-            url = urljoin(base_url, href)
-            
-            # 查找日期
-            date_text = ""
-            date_span = item.find("span", class_=re.compile(r"date|time|Article_PublishDate"))
-            if date_span:
-                date_text = date_span.get_text(strip=True)
-            else:
-                item_text = item.get_text()
-                date_match = re.search(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2})", item_text)
-                if date_match:
-                    date_text = date_match.group(1).replace("/", "-")
-            
-            # 验证是否为有效新闻
-            if is_valid_news(title, url, date_text):
-                news_list.append({
-                    "source": "同济大学",
-                    "title": title,
-                    "date": date_text,
-                    "url": url
-                })
-        except Exception:
-            continue
-    
-    return news_list
-
-
-def parse_ecnu(html: str, base_url: str) -> List[Dict]:
-    """
-    解析华东师范大学统战部新闻列表
-    网页结构类似复旦，使用 list.htm 格式
-    """
-    news_list = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    # 查找新闻列表项
-    news_items = soup.select("ul.news_list li, ul.wp_article_list li, div.news_list li")
-    
-    if not news_items:
-        news_items = []
-        for li in soup.find_all("li"):
-            text = li.get_text()
-            if re.search(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}", text):
-                news_items.append(li)
-    
-    for item in news_items:
-        try:
-            link = item.find("a")
-            if not link or not link.get("href"):
-                continue
-            
-            title = link.get_text(strip=True)
-            href = link.get("href", "")
-            url = urljoin(base_url, href)
-            
-            # 查找日期
-            date_text = ""
-            date_span = item.find("span", class_=re.compile(r"date|time|Article_PublishDate"))
-            if date_span:
-                date_text = date_span.get_text(strip=True)
-            else:
-                item_text = item.get_text()
-                date_match = re.search(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2})", item_text)
-                if date_match:
-                    date_text = date_match.group(1).replace("/", "-")
-            
-            if is_valid_news(title, url, date_text):
-                news_list.append({
-                    "source": "华东师范大学",
-                    "title": title,
-                    "date": date_text,
-                    "url": url
-                })
-        except Exception:
-            continue
-    
-    return news_list
-
-
-def parse_shnu(html: str, base_url: str) -> List[Dict]:
-    """
-    解析上海师范大学统战部新闻列表
-    网页结构类似复旦，使用 list.htm 格式
-    """
-    news_list = []
-    soup = BeautifulSoup(html, "lxml")
-    
-    # 查找新闻列表项
-    news_items = soup.select("ul.news_list li, ul.wp_article_list li, div.news_list li")
-    
-    if not news_items:
-        news_items = []
-        for li in soup.find_all("li"):
-            text = li.get_text()
-            if re.search(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}", text):
-                news_items.append(li)
-    
-    for item in news_items:
-        try:
-            link = item.find("a")
-            if not link or not link.get("href"):
-                continue
-            
-            title = link.get_text(strip=True)
-            href = link.get("href", "")
-            url = urljoin(base_url, href)
-            
-            # 查找日期
-            date_text = ""
-            date_span = item.find("span", class_=re.compile(r"date|time|Article_PublishDate"))
-            if date_span:
-                date_text = date_span.get_text(strip=True)
-            else:
-                item_text = item.get_text()
-                date_match = re.search(r"(\d{4}[-/]\d{1,2}[-/]\d{1,2})", item_text)
-                if date_match:
-                    date_text = date_match.group(1).replace("/", "-")
-            
-            if is_valid_news(title, url, date_text):
-                news_list.append({
-                    "source": "上海师范大学",
-                    "title": title,
-                    "date": date_text,
-                    "url": url
-                })
-        except Exception:
-            continue
-    
-    return news_list
-
-
-def parse_shsy(html: str, base_url: str) -> List[Dict]:
+def parse_shsy(html: str, base_url: str) -> NewsColumns:
     """
     解析上海市社会主义学院新闻列表
-    该网站使用 JS 变量存储新闻数据，需要特殊处理
+    该网站使用 JS 变量存储新闻数据，传入的 html 为 data_url 对应的 JS 文件内容
     """
-    news_list = []
+    sources, titles, dates, urls, date_keys = [], [], [], [], []
     
-    # 尝试直接获取 JSON 数据
     try:
-        json_url = "https://www.shsy.org.cn/json/gzdt.js"
-        response = requests.get(json_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        response.encoding = 'utf-8'
-        js_content = response.text
-        
         # 提取 JSON 数组
         # 格式: var gzdtList = [...]
-        match = re.search(r'var\s+gzdtList\s*=\s*(\[.*\])', js_content, re.DOTALL)
+        match = _GZDT_RE.search(html)
         if match:
-            import json
             json_str = match.group(1)
-            data = json.loads(json_str)
+            data = orjson.loads(json_str.encode("utf-8"))
             
             for item in data:
                 try:
@@ -410,94 +380,105 @@ def parse_shsy(html: str, base_url: str) -> List[Dict]:
                         continue
                     
                     if title and len(title) >= 2 and date_text:
-                        news_list.append({
-                            "source": "上海市社会主义学院",
-                            "title": title,
-                            "date": date_text,
-                            "url": url
-                        })
+                        sources.append("上海市社会主义学院")
+                        titles.append(title)
+                        dates.append(date_text)
+                        urls.append(url)
+                        date_keys.append(_date_key(date_text))
                 except Exception:
                     continue
     except Exception as e:
         print(f"解析上海市社会主义学院失败: {e}")
     
-    return news_list
+    return {"source": sources, "title": titles, "date": dates, "url": urls, "date_key": date_keys}
 
 
 # 解析器映射
 PARSERS = {
-    "fudan": parse_fudan,
+    "fudan": partial(_parse_generic, source="复旦大学"),
     "sjtu": parse_sjtu,
-    "tongji": parse_tongji,
-    "ecnu": parse_ecnu,
-    "shnu": parse_shnu,
+    "tongji": partial(_parse_generic, source="同济大学"),
+    "ecnu": partial(_parse_generic, source="华东师范大学"),
+    "shnu": partial(_parse_generic, source="上海师范大学"),
     "shsy": parse_shsy,
 }
 
 
-def scrape_university(name: str, config: Dict) -> tuple[str, List[Dict], Optional[str]]:
+async def scrape_university(session: aiohttp.ClientSession, name: str,
+                            config: Dict) -> tuple[str, NewsColumns, Optional[str]]:
     """
     爬取单个高校的新闻
     返回: (高校名, 新闻列表, 错误信息)
     """
     try:
-        html = fetch_page(config["url"])
+        # JS 数据文件需要完整读取，截断会破坏其中的 JSON
+        if config.get("content_type") == "js_jsonp":
+            html = await fetch_page(session, config["data_url"], max_bytes=None)
+        else:
+            html = await fetch_page(session, config["url"])
         if html is None:
-            return (name, [], f"{name}网站访问超时或失败")
+            return (name, empty_news(), f"{name}网站访问超时或失败")
         
         parser = PARSERS.get(config["parser"])
         if parser is None:
-            return (name, [], f"{name}解析器未找到")
+            return (name, empty_news(), f"{name}解析器未找到")
         
-        news = parser(html, config["base_url"])
+        # 解析放到线程中执行，与其他高校仍在进行的网络请求重叠
+        news = await asyncio.to_thread(parser, html, config["base_url"])
         return (name, news, None)
     except Exception as e:
-        return (name, [], f"{name}爬取异常: {str(e)}")
+        return (name, empty_news(), f"{name}爬取异常: {str(e)}")
 
 
-def scrape_all_universities() -> tuple[List[Dict], List[str]]:
+async def scrape_all_universities_async() -> tuple[NewsColumns, List[str]]:
     """
-    并发爬取所有高校的新闻
-    返回: (所有新闻列表, 错误信息列表)
+    在单个事件循环中并发爬取所有高校的新闻
+    返回: (所有新闻（按列存储）, 错误信息列表)
     """
-    all_news = []
+    all_news = empty_news()
     errors = []
     
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(scrape_university, name, config): name
-            for name, config in UNIVERSITIES.items()
-        }
-        
-        for future in as_completed(futures):
-            name, news, error = future.result()
-            if error:
-                errors.append(error)
-            all_news.extend(news)
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, ttl_dns_cache=DNS_CACHE_TTL)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        results = await asyncio.gather(
+            *[scrape_university(session, name, config) for name, config in UNIVERSITIES.items()],
+            return_exceptions=True
+        )
     
-    # 按日期倒序排序（最新在前）
-    def parse_date(item):
-        date_str = item.get("date", "")
-        if date_str:
-            try:
-                # 统一日期格式为 YYYY-MM-DD
-                date_str = date_str.replace("/", "-")
-                return date_str
-            except Exception:
-                pass
-        return "0000-00-00"
+    for name, result in zip(UNIVERSITIES, results):
+        if isinstance(result, BaseException):
+            errors.append(f"{name}爬取异常: {str(result)}")
+            continue
+        _, news, error = result
+        if error:
+            errors.append(error)
+        for field in NEWS_FIELDS:
+            all_news[field].extend(news[field])
     
-    all_news.sort(key=parse_date, reverse=True)
+    # 按日期倒序排序（最新在前）
+    date_keys = all_news["date_key"]
+    order = sorted(range(len(date_keys)), key=date_keys.__getitem__, reverse=True)
+    for field in NEWS_FIELDS:
+        column = all_news[field]
+        all_news[field] = [column[i] for i in order]
     
     return all_news, errors
 
 
+def scrape_all_universities() -> tuple[NewsColumns, List[str]]:
+    """
+    并发爬取所有高校的新闻（同步入口）
+    返回: (所有新闻（按列存储）, 错误信息列表)
+    """
+    return asyncio.run(scrape_all_universities_async())
+
+
 if __name__ == "__main__":
     # 测试爬虫
     news, errors = scrape_all_universities()
-    print(f"共获取 {len(news)} 条新闻")
+    print(f"共获取 {len(news['title'])} 条新闻")
     if errors:
         print(f"错误: {errors}")
-    for item in news[:5]:
-        print(f"[{item['source']}] {item['date']} - {item['title']}")
+    for source, date_text, title in zip(news["source"][:5], news["date"][:5], news["title"][:5]):
+        print(f"[{source}] {date_text} - {title}")
 